@@ -1,73 +1,569 @@
+from contextlib import contextmanager
+
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
 import maya.cmds as cmds
-import maya.mel as mel
+import maya.utils
+
+# NumPy and SciPy are optional, they are only needed for weight inpainting
+try:
+    import numpy as np
+    from scipy import sparse
+    from scipy.sparse.linalg import spsolve
+    from scipy.spatial import cKDTree
+    INPAINT_AVAILABLE = True
+except ImportError:
+    INPAINT_AVAILABLE = False
+
+# Number of targets copied per deferred callback, the UI redraws between chunks
+CHUNK_SIZE = 5
+
+# Full DAG path of every item shown in the lists, keyed by textScrollList and displayed name
+item_paths = {}
+
+# True while a deferred batch copy is running. Kept when the script is run again mid-batch,
+# so a new UI cannot start a second batch on top of it.
+batch_running = globals().get("batch_running", False)
+
+def find_skin_cluster(obj):
+    """
+    Returns the skin cluster deforming the given object, or None if it is not skinned.
+    Args:
+        obj (str): Name of the object.
+    """
+    history = cmds.listHistory(obj, pruneDagObjects=True, interestLevel=2) or []
+    return next((node for node in history if cmds.nodeType(node) == "skinCluster"), None)
+
+def match_skin_cluster_settings(source_skin_cluster, target_skin_cluster):
+    """
+    Mirrors the skinning method and dual quaternion scale setup of the source skin cluster on the target.
+    Args:
+        source_skin_cluster (str): Name of the source skin cluster.
+        target_skin_cluster (str): Name of the target skin cluster.
+    """
+    skinning_method = cmds.getAttr(source_skin_cluster + ".skinningMethod")
+    cmds.setAttr(target_skin_cluster + ".skinningMethod", skinning_method)
+
+    # Dual quaternion (1) and weight blended (2) modes also depend on the scale settings
+    if skinning_method in (1, 2):
+        cmds.setAttr(target_skin_cluster + ".dqsSupportNonRigid", cmds.getAttr(source_skin_cluster + ".dqsSupportNonRigid"))
+        scale_plugs = cmds.listConnections(source_skin_cluster + ".dqsScale", plugs=True, source=True, destination=False)
+        if scale_plugs:
+            cmds.connectAttr(scale_plugs[0], target_skin_cluster + ".dqsScale", force=True)
+        else:
+            cmds.setAttr(target_skin_cluster + ".dqsScale", *cmds.getAttr(source_skin_cluster + ".dqsScale")[0], type="double3")
+
+def get_skin_cluster_fn(skin_cluster):
+    """
+    Returns an MFnSkinCluster function set for the given skin cluster.
+    Args:
+        skin_cluster (str): Name of the skin cluster.
+    """
+    selection = om.MSelectionList()
+    selection.add(skin_cluster)
+    return oma.MFnSkinCluster(selection.getDependNode(0))
+
+def get_all_vertices(vertex_count):
+    """
+    Returns a mesh vertex component holding every vertex index.
+    Args:
+        vertex_count (int): Number of vertices of the mesh.
+    """
+    components = om.MFnSingleIndexedComponent()
+    vertices = components.create(om.MFn.kMeshVertComponent)
+    components.setCompleteData(vertex_count)
+    return vertices
+
+def get_skin_data(skin_cluster, cache=None):
+    """
+    Collects the deformed shape, influence names and weights of a skin cluster deforming a mesh.
+    Args:
+        skin_cluster (str): Name of the skin cluster.
+        cache (dict): Filled on first use and reused afterwards, so a batch only reads the source once.
+    Returns:
+        dict: Keys "shape", "influences", "vertex_count", "weights" and "influence_count",
+            or None if the skin cluster does not deform a mesh. copy_weights_inpainted adds its source arrays to it.
+    """
+    if cache is not None and "data" in cache:
+        return cache["data"]
+
+    data = None
+    skin_fn = get_skin_cluster_fn(skin_cluster)
+    shape = skin_fn.getPathAtIndex(0)
+    if shape.hasFn(om.MFn.kMesh):
+        vertex_count = om.MFnMesh(shape).numVertices
+        weights, influence_count = skin_fn.getWeights(shape, get_all_vertices(vertex_count))
+        data = {
+            "shape": shape,
+            "influences": [path.partialPathName() for path in skin_fn.influenceObjects()],
+            "vertex_count": vertex_count,
+            "weights": weights,
+            "influence_count": influence_count,
+        }
+
+    if cache is not None:
+        cache["data"] = data
+    return data
+
+def get_influence_indices(source_influences, target_fn, exact=True):
+    """
+    Maps the source influences to their indices on the target skin cluster.
+    Args:
+        source_influences (list): Influence names of the source skin cluster.
+        target_fn (MFnSkinCluster): Function set of the target skin cluster.
+        exact (bool): Require both skin clusters to have the same influences,
+            otherwise the target only needs to contain the source influences.
+    Returns:
+        MIntArray: Target influence indices in source order, or None if the influences do not match.
+    """
+    target_influences = {path.partialPathName(): index for index, path in enumerate(target_fn.influenceObjects())}
+    if exact and set(source_influences) != set(target_influences):
+        return None
+    if not set(source_influences).issubset(target_influences):
+        return None
+    return om.MIntArray([target_influences[name] for name in source_influences])
+
+def copy_weights_by_index(source_skin_cluster, target_skin_cluster, source_cache=None):
+    """
+    Copies the full weight matrix vertex-by-vertex with the OpenMaya API.
+    Source and target must share vertex count and influences.
+    The weights are not undoable, only use this on a skin cluster created in the same undo chunk.
+    Args:
+        source_skin_cluster (str): Name of the source skin cluster.
+        target_skin_cluster (str): Name of the target skin cluster.
+        source_cache (dict): Cache passed to get_skin_data for the source skin cluster.
+    Returns:
+        bool: True if the weights were copied, False if the source is not a mesh or the influences do not match.
+    """
+    source_data = get_skin_data(source_skin_cluster, source_cache)
+    if source_data is None:
+        return False
+    target_fn = get_skin_cluster_fn(target_skin_cluster)
+
+    influence_indices = get_influence_indices(source_data["influences"], target_fn)
+    if influence_indices is None:
+        return False
 
-def copy_skin_weights(source, target):
+    vertices = get_all_vertices(source_data["vertex_count"])
+    target_fn.setWeights(target_fn.getPathAtIndex(0), vertices, influence_indices, source_data["weights"], False)
+    return True
+
+def get_mesh_data(shape):
+    """
+    Returns the world space points, vertex normals and triangle indices of a mesh as NumPy arrays.
+    Args:
+        shape (MDagPath): Path to the mesh shape.
+    """
+    mesh_fn = om.MFnMesh(shape)
+    points = np.array(mesh_fn.getPoints(om.MSpace.kWorld))[:, :3]
+    normals = np.array(mesh_fn.getVertexNormals(True, om.MSpace.kWorld))
+    _, triangle_vertices = mesh_fn.getTriangles()
+    triangles = np.array(triangle_vertices, dtype=np.int64).reshape(-1, 3)
+    return points, normals, triangles
+
+def cotangent_laplacian(points, triangles):
+    """
+    Builds the cotangent Laplacian of a triangle mesh as a sparse matrix.
+    Args:
+        points (numpy.ndarray): Vertex positions, shape (n, 3).
+        triangles (numpy.ndarray): Triangle vertex indices, shape (m, 3).
+    """
+    rows, cols, values = [], [], []
+    for a, b, c in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+        i, j, k = triangles[:, a], triangles[:, b], triangles[:, c]
+        u = points[i] - points[k]
+        v = points[j] - points[k]
+        # Cotangent of the angle opposite to edge (i, j)
+        cot = (u * v).sum(axis=1) / np.maximum(np.linalg.norm(np.cross(u, v), axis=1), 1e-12)
+        rows.extend((i, j))
+        cols.extend((j, i))
+        values.extend((0.5 * cot, 0.5 * cot))
+
+    count = len(points)
+    adjacency = sparse.coo_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))), shape=(count, count)).tocsr()
+    return sparse.diags(np.asarray(adjacency.sum(axis=1)).ravel()) - adjacency
+
+def copy_weights_inpainted(source_skin_cluster, target_skin_cluster, source_cache=None, distance_ratio=0.05, normal_threshold=30.0, layered_mesh_support=False):
+    """
+    Copies weights between meshes of different topology in two stages.
+    Target vertices with a close source vertex of similar normal take its weights directly,
+    the remaining weights are inpainted by solving a Laplace equation over the target mesh.
+    The weights are not undoable, only use this on a skin cluster created in the same undo chunk.
+    Args:
+        source_skin_cluster (str): Name of the source skin cluster.
+        target_skin_cluster (str): Name of the target skin cluster.
+        source_cache (dict): Cache passed to get_skin_data for the source skin cluster.
+        distance_ratio (float): Maximum match distance as a fraction of the target bounding box diagonal.
+        normal_threshold (float): Maximum angle in degrees between matched vertex normals.
+        layered_mesh_support (bool): Also accept matches with opposite normals, for layered garments.
+    Returns:
+        bool: True if the weights were copied, False if inpainting cannot be used.
+    """
+    if not INPAINT_AVAILABLE:
+        return False
+
+    source_data = get_skin_data(source_skin_cluster, source_cache)
+    if source_data is None:
+        return False
+    target_fn = get_skin_cluster_fn(target_skin_cluster)
+
+    influence_indices = get_influence_indices(source_data["influences"], target_fn, exact=False)
+    if influence_indices is None:
+        return False
+
+    # The source arrays and KD-tree are built once and kept in the cached source data for the next targets
+    if "tree" not in source_data:
+        source_points, source_normals, _ = get_mesh_data(source_data["shape"])
+        source_data["points"] = source_points
+        source_data["normals"] = source_normals
+        source_data["tree"] = cKDTree(source_points)
+        source_data["weight_matrix"] = np.array(source_data["weights"]).reshape(-1, source_data["influence_count"])
+    source_normals = source_data["normals"]
+    source_weights = source_data["weight_matrix"]
+    influence_count = source_data["influence_count"]
+
+    target_shape = target_fn.getPathAtIndex(0)
+    target_points, target_normals, target_triangles = get_mesh_data(target_shape)
+
+    # Stage 1: closest point matching filtered by distance and normal angle
+    max_distance = distance_ratio * np.linalg.norm(target_points.max(axis=0) - target_points.min(axis=0))
+    distances, nearest = source_data["tree"].query(target_points)
+    alignment = (target_normals * source_normals[nearest]).sum(axis=1)
+    if layered_mesh_support:
+        alignment = np.abs(alignment)
+    matched = (distances <= max_distance) & (alignment >= np.cos(np.radians(normal_threshold)))
+    if not matched.any():
+        return False
+
+    weights = source_weights[nearest]
+
+    # Stage 2: inpaint unmatched vertices with the matched weights as boundary conditions
+    unmatched = ~matched
+    if unmatched.any():
+        laplacian = cotangent_laplacian(target_points, target_triangles).tocsr()
+        laplacian_unknown = laplacian[unmatched][:, unmatched]
+        laplacian_known = laplacian[unmatched][:, matched]
+        # Tiny regularisation keeps islands without matched vertices solvable
+        system = (laplacian_unknown + sparse.identity(laplacian_unknown.shape[0]) * 1e-8).tocsc()
+        solved = spsolve(system, -laplacian_known @ weights[matched])
+        solved = np.clip(solved.reshape(-1, influence_count), 0.0, 1.0)
+        # Islands the solve could not reach keep their closest point weights
+        reached = solved.sum(axis=1) > 1e-6
+        unmatched_weights = weights[unmatched]
+        unmatched_weights[reached] = solved[reached]
+        weights[unmatched] = unmatched_weights
+
+    weights /= np.maximum(weights.sum(axis=1, keepdims=True), 1e-12)
+
+    # Write every target influence so the ones missing on the source are cleared instead of keeping old weights
+    target_influence_count = len(target_fn.influenceObjects())
+    target_weights = np.zeros((len(target_points), target_influence_count))
+    target_weights[:, list(influence_indices)] = weights
+
+    target_vertices = get_all_vertices(len(target_points))
+    all_influences = om.MIntArray(list(range(target_influence_count)))
+    target_fn.setWeights(target_shape, target_vertices, all_influences, om.MDoubleArray(target_weights.ravel().tolist()), False)
+    return True
+
+def copy_skin_weights(source, target, source_skin_cluster=None, joints=None, inpaint=False, source_cache=None):
     """
     Function to copy skin weights from source to target.
     Args:
         source (str): Name of the source object.
         target (str): Name of the target object.
+        source_skin_cluster (str): Skin cluster of the source, resolved once per batch if given.
+        joints (list): Influences of the source skin cluster, resolved once per batch if given.
+        inpaint (bool): Inpaint unmatched weights instead of copySkinWeights on targets bound here.
+        source_cache (dict): Cache for get_skin_data shared by the batch, so the source weights are only read once.
+    Returns:
+        str: Transfer method used, "index" or "inpaint" (written through the API, not redoable) or "copySkinWeights".
     """
     # Get the skin cluster of the source
-    source_skin_cluster = mel.eval('findRelatedSkinCluster("%s")' % source)
+    if not source_skin_cluster:
+        source_skin_cluster = find_skin_cluster(source)
 
     if not source_skin_cluster:
         cmds.error("Source object has no skin cluster.")
         return
 
     # Check if target is already bound
-    target_skin_cluster = mel.eval('findRelatedSkinCluster("%s")' % target)
-    
-    if not target_skin_cluster:
+    target_skin_cluster = find_skin_cluster(target)
+
+    # Weights set through the API do not enter the undo queue, so that path is only used on skin clusters
+    # created here: undoing the bind removes them together with their weights. Redo only replays the bind.
+    new_bind = not target_skin_cluster
+    if new_bind:
         # Bind the target object to the same joints as the source
-        joints = cmds.skinCluster(source_skin_cluster, q=True, inf=True)
-        target_skin_cluster = cmds.skinCluster(joints, target, tsb=True)[0]
+        if not joints:
+            joints = cmds.skinCluster(source_skin_cluster, q=True, inf=True)
+        max_influences = cmds.skinCluster(source_skin_cluster, q=True, maximumInfluences=True)
+        maintain_max = cmds.skinCluster(source_skin_cluster, q=True, obeyMaxInfluences=True)
+        target_skin_cluster = cmds.skinCluster(joints, target, tsb=True, maximumInfluences=max_influences, obeyMaxInfluences=maintain_max)[0]
+        match_skin_cluster_settings(source_skin_cluster, target_skin_cluster)
+
+    # Transfer by vertex index when the topology matches
+    same_topology = cmds.polyEvaluate(source, vertex=True) == cmds.polyEvaluate(target, vertex=True)
+    if new_bind and same_topology and copy_weights_by_index(source_skin_cluster, target_skin_cluster, source_cache=source_cache):
+        cmds.skinCluster(target_skin_cluster, e=True, forceNormalizeWeights=True)
+        return "index"
+    if new_bind and inpaint and copy_weights_inpainted(source_skin_cluster, target_skin_cluster, source_cache=source_cache):
+        cmds.skinCluster(target_skin_cluster, e=True, forceNormalizeWeights=True)
+        return "inpaint"
 
     # Copy skin weights
     cmds.copySkinWeights(ss=source_skin_cluster, ds=target_skin_cluster, noMirror=True, surfaceAssociation='closestPoint', influenceAssociation='closestJoint')
-    cmds.select(target)
-    cmds.warning(f"Skin weights copied from {source} to {target}.")
+    return "copySkinWeights"
+
+def get_mesh_targets(items):
+    """
+    Returns the items that are (non-intermediate) mesh shapes or their transforms, in their original order.
+    Invalid items are reported in a single warning.
+    Args:
+        items (list): Names of the target objects.
+    """
+    meshes = set()
+    existing = cmds.ls(items, long=True)
+    if existing:
+        # Mesh shapes added directly are valid targets as they are
+        meshes.update(cmds.ls(existing, type="mesh", noIntermediate=True, long=True) or [])
+        shapes = cmds.listRelatives(existing, shapes=True, type="mesh", noIntermediate=True, fullPath=True)
+        if shapes:
+            meshes.update(cmds.listRelatives(shapes, parent=True, fullPath=True) or [])
+
+    valid = [item for item in items if item in meshes]
+    invalid = [item for item in items if item not in meshes]
+    if invalid:
+        cmds.warning("Skipping objects without a mesh: " + ", ".join(invalid))
+    return valid
+
+@contextmanager
+def suspend_refresh():
+    """
+    Suspends viewport refresh for a chunk of copies so the scene redraws once at the end of it.
+    """
+    cmds.refresh(suspend=True)
+    try:
+        yield
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.refresh(force=True)
+
+def set_copy_buttons_enabled(enabled):
+    """
+    Enables or disables the buttons that start a batch, if the UI still exists.
+    Args:
+        enabled (bool): New enabled state.
+    """
+    for button in (copy_button, toggle_button):
+        if cmds.button(button, exists=True):
+            cmds.button(button, e=True, enable=enabled)
+
+def get_display_names(paths):
+    """
+    Returns the shortest unique name of each full DAG path, as shown in the lists.
+    Args:
+        paths (list): Full DAG paths.
+    """
+    names = []
+    selection = om.MSelectionList()
+    for path in paths:
+        selection.clear()
+        selection.add(path)
+        names.append(selection.getSelectionStrings(0)[0])
+    return names
+
+def get_list_paths(scroll_list):
+    """
+    Returns the full DAG paths behind the names shown in a list.
+    Args:
+        scroll_list (str): Name of the textScrollList.
+    """
+    names = cmds.textScrollList(scroll_list, q=True, allItems=True) or []
+    paths_by_name = item_paths.get(scroll_list, {})
+    return [paths_by_name.get(name, name) for name in names]
+
+def append_unique(scroll_list, paths):
+    """
+    Appends the paths not already in the list in a single call, skipping duplicates.
+    The list shows their shortest unique names, the full paths are kept in item_paths.
+    A name already used by another row is shown as the full path instead.
+    Args:
+        scroll_list (str): Name of the textScrollList.
+        paths (list): Full DAG paths to append.
+    """
+    paths_by_name = item_paths.setdefault(scroll_list, {})
+    existing_paths = set(paths_by_name.values())
+    new_paths = []
+    for path in paths:
+        if path not in existing_paths:
+            existing_paths.add(path)
+            new_paths.append(path)
+    if new_paths:
+        names = []
+        for name, path in zip(get_display_names(new_paths), new_paths):
+            # A name still mapped to another row (renamed or reparented since) falls back to the full path
+            if paths_by_name.get(name, path) != path:
+                name = path
+            paths_by_name[name] = path
+            names.append(name)
+        cmds.textScrollList(scroll_list, e=True, append=names)
+
+def remove_selected(scroll_list):
+    """
+    Removes the selected items from a list in a single call.
+    Args:
+        scroll_list (str): Name of the textScrollList.
+    """
+    selected_items = cmds.textScrollList(scroll_list, q=True, selectItem=True)
+    if selected_items:
+        cmds.textScrollList(scroll_list, e=True, removeItem=selected_items)
+        paths_by_name = item_paths.get(scroll_list, {})
+        for name in selected_items:
+            paths_by_name.pop(name, None)
+    else:
+        cmds.warning("No item selected in the list.")
+
+def clear_list(scroll_list):
+    """
+    Clears all items from a list.
+    Args:
+        scroll_list (str): Name of the textScrollList.
+    """
+    cmds.textScrollList(scroll_list, e=True, removeAll=True)
+    item_paths.pop(scroll_list, None)
+
+def sort_list(scroll_list):
+    """
+    Sorts the items of a list alphabetically by object name.
+    Args:
+        scroll_list (str): Name of the textScrollList.
+    """
+    items = cmds.textScrollList(scroll_list, q=True, allItems=True)
+    if items:
+        sorted_items = sorted(items, key=lambda name: (name.rsplit("|", 1)[-1], name))
+        cmds.textScrollList(scroll_list, e=True, removeAll=True)
+        cmds.textScrollList(scroll_list, e=True, append=sorted_items)
+
+def run_batch(pairs, on_finish, **copy_kwargs):
+    """
+    Copies skin weights for each (source, target) pair in chunks of CHUNK_SIZE, one deferred callback per chunk,
+    so the UI stays responsive and the batch can be cancelled from the progress window (Esc).
+    The whole batch is a single undo chunk run with the evaluation manager off and Script Editor warnings suppressed,
+    the copy buttons are disabled until it ends. Scene edits made while it runs become part of its undo chunk.
+    Args:
+        pairs (list): (source, target) pairs to copy.
+        on_finish (callable): Called with the list of copied targets and whether the batch failed,
+            once the batch is done, cancelled or failed.
+        copy_kwargs: Extra arguments passed to copy_skin_weights.
+    """
+    global batch_running
+    if batch_running:
+        cmds.warning("A skin weight copy is already running.")
+        return
+
+    # Only snapshot the settings when no batch has changed them
+    batch_running = True
+    copied = []
+    methods = []
+    finished = False
+    suppress_warnings = cmds.scriptEditorInfo(q=True, suppressWarnings=True)
+    evaluation_mode = cmds.evaluationManager(q=True, mode=True)[0]
+
+    def finish(failed=False):
+        global batch_running
+        nonlocal finished
+        if finished:
+            return
+        finished = True
+        try:
+            cmds.progressWindow(endProgress=True)
+            cmds.evaluationManager(mode=evaluation_mode)
+            cmds.scriptEditorInfo(suppressWarnings=suppress_warnings)
+            cmds.undoInfo(closeChunk=True)
+            set_copy_buttons_enabled(True)
+        finally:
+            batch_running = False
+
+        api_count = sum(method in ("index", "inpaint") for method in methods)
+        if api_count:
+            cmds.warning(f"Weights on {api_count} object(s) were written through the API and cannot be redone. "
+                         "After undoing this copy, run it again instead of using Redo.")
+        if copy_kwargs.get("inpaint") and "copySkinWeights" in methods:
+            cmds.warning(f"Inpainting was not used on {methods.count('copySkinWeights')} object(s) that were already skinned "
+                         "or had no matching vertices, they were copied with copySkinWeights.")
+        on_finish(copied, failed)
+
+    def run_chunk(start):
+        try:
+            if cmds.progressWindow(q=True, isCancelled=True):
+                finish()
+                return
+
+            chunk = pairs[start:start + CHUNK_SIZE]
+            with suspend_refresh():
+                for source, target in chunk:
+                    methods.append(copy_skin_weights(source, target, **copy_kwargs))
+                    copied.append(target)
+
+            cmds.progressWindow(e=True, step=len(chunk))
+            if start + CHUNK_SIZE < len(pairs):
+                maya.utils.executeDeferred(run_chunk, start + CHUNK_SIZE)
+            else:
+                finish()
+        except Exception:
+            finish(failed=True)
+            raise
+
+    try:
+        set_copy_buttons_enabled(False)
+        cmds.undoInfo(openChunk=True, chunkName="BatchCopySkin")
+        cmds.scriptEditorInfo(suppressWarnings=True)
+        cmds.evaluationManager(mode="off")
+        cmds.progressWindow(title="Copy Skin", status="Copying skin weights...", isInterruptable=True, progress=0, maxValue=len(pairs))
+        maya.utils.executeDeferred(run_chunk, 0)
+    except Exception:
+        finish(failed=True)
+        raise
 
 def add_to_source():
     """
-    Adds the selected object(s) to the source list (Column A).
+    Adds the selected object(s) to the source list (Column A) by their full DAG path.
     """
-    selected = cmds.ls(selection=True)
+    selected = cmds.ls(selection=True, long=True)
     if selected:
-        existing_items = cmds.textScrollList(source_list, q=True, allItems=True) or []
-        for obj in selected:
-            if obj not in existing_items:
-                cmds.textScrollList(source_list, e=True, append=obj)
+        append_unique(source_list, selected)
     else:
         cmds.warning("No object selected.")
 
 def add_to_target():
     """
-    Adds the selected objects to the target list (Column B).
-    If a group is selected, it adds all objects in the hierarchy (excluding the group itself).
+    Adds the selected objects to the target list (Column B) by their full DAG path.
+    If a group is selected, it adds all meshes in the hierarchy (excluding the group itself).
     """
-    selected = cmds.ls(selection=True)
+    selected = cmds.ls(selection=True, long=True)
     if selected:
+        # Find the transforms (groups) in the selection with a single query
+        transforms = set(cmds.ls(selected, exactType="transform", long=True) or [])
+        groups = [obj for obj in selected if obj in transforms]
+
+        mesh_transforms = []
+        if groups:
+            # Get the transforms of all mesh shapes in the hierarchies, skipping intermediate shapes
+            shapes = cmds.listRelatives(groups, allDescendents=True, type="mesh", noIntermediate=True, fullPath=True) or []
+            if shapes:
+                mesh_transforms = cmds.listRelatives(shapes, parent=True, fullPath=True) or []
+
+        # Keep the selection order, it is the pairing in one-to-one mode
         all_objects_to_add = []
-
         for obj in selected:
-            # Check if the selected object is a transform (group)
-            if cmds.objectType(obj) == "transform":
-                # Get all child shapes of the group
-                children = cmds.listRelatives(obj, allDescendents=True, type="transform")
-                if children:
-                    all_objects_to_add.extend(children)
-                else:
-                    all_objects_to_add.append(obj)
+            if obj in transforms:
+                all_objects_to_add.extend(path for path in mesh_transforms if path == obj or path.startswith(obj + "|"))
             else:
                 # Add the object directly if it is not a group
                 all_objects_to_add.append(obj)
 
         # Add objects to the list, ensuring no duplicates
-        existing_items = cmds.textScrollList(target_list, q=True, allItems=True) or []
-        for obj in all_objects_to_add:
-            if obj not in existing_items:
-                cmds.textScrollList(target_list, e=True, append=obj)
+        append_unique(target_list, all_objects_to_add)
 
     else:
         cmds.warning("No object selected.")
@@ -76,30 +572,24 @@ def remove_selected_from_source():
     """
     Removes the selected item from the source list (Column A).
     """
-    selected_items = cmds.textScrollList(source_list, q=True, selectItem=True)
-    if selected_items:
-        for item in selected_items:
-            cmds.textScrollList(source_list, e=True, removeItem=item)
-    else:
-        cmds.warning("No item selected in the list.")
+    remove_selected(source_list)
 
 def remove_selected_from_target():
     """
     Removes the selected item from the target list (Column B).
     """
-    selected_items = cmds.textScrollList(target_list, q=True, selectItem=True)
-    if selected_items:
-        for item in selected_items:
-            cmds.textScrollList(target_list, e=True, removeItem=item)
-    else:
-        cmds.warning("No item selected in the list.")
+    remove_selected(target_list)
 
 def copy_weights_button_pressed():
     """
     Function called when the 'Copy Skin Weights' button is pressed in single source mode.
     """
-    source_items = cmds.textScrollList(source_list, q=True, allItems=True)
-    target_items = cmds.textScrollList(target_list, q=True, allItems=True)
+    if batch_running:
+        cmds.warning("A skin weight copy is already running.")
+        return
+
+    source_items = get_list_paths(source_list)
+    target_items = get_list_paths(target_list)
 
     if not source_items:
         cmds.warning("Please add a source object to Column A.")
@@ -108,17 +598,41 @@ def copy_weights_button_pressed():
         cmds.warning("Please add at least one target object to Column B.")
         return
 
+    target_items = get_mesh_targets(target_items)
+    if not target_items:
+        return
+
     source = source_items[0]
+    inpaint = cmds.checkBox(inpaint_checkbox, q=True, value=True)
+
+    # Resolve the source skin cluster and its influences once for the whole batch
+    source_skin_cluster = find_skin_cluster(source)
+    if not source_skin_cluster:
+        cmds.error("Source object has no skin cluster.")
+        return
+    joints = cmds.skinCluster(source_skin_cluster, q=True, inf=True)
+
+    def on_finish(copied, failed):
+        if copied:
+            cmds.select(copied, r=True)
+        if failed:
+            cmds.warning(f"Copying skin weights from {source} failed after {len(copied)} object(s).")
+        else:
+            cmds.warning(f"Skin weights copied from {source} to {len(copied)} object(s).")
 
-    for target in target_items:
-        copy_skin_weights(source, target)
+    pairs = [(source, target) for target in target_items]
+    run_batch(pairs, on_finish, source_skin_cluster=source_skin_cluster, joints=joints, inpaint=inpaint, source_cache={})
 
 def copy_weights_one_to_one():
     """
     Function to copy skin weights from Column A to Column B one-to-one.
     """
-    source_items = cmds.textScrollList(source_list, q=True, allItems=True)
-    target_items = cmds.textScrollList(target_list, q=True, allItems=True)
+    if batch_running:
+        cmds.warning("A skin weight copy is already running.")
+        return
+
+    source_items = get_list_paths(source_list)
+    target_items = get_list_paths(target_list)
 
     if not source_items:
         cmds.warning("Please add at least one source object to Column A.")
@@ -130,20 +644,34 @@ def copy_weights_one_to_one():
         cmds.warning("The number of objects in Column A and Column B must be the same.")
         return
 
-    for source, target in zip(source_items, target_items):
-        copy_skin_weights(source, target)
+    valid_targets = set(get_mesh_targets(target_items))
+    pairs = [(source, target) for source, target in zip(source_items, target_items) if target in valid_targets]
+    if not pairs:
+        return
+
+    inpaint = cmds.checkBox(inpaint_checkbox, q=True, value=True)
+
+    def on_finish(copied, failed):
+        if copied:
+            cmds.select(copied, r=True)
+        if failed:
+            cmds.warning(f"Copying skin weights failed after {len(copied)} object(s).")
+        else:
+            cmds.warning(f"Skin weights copied to {len(copied)} object(s).")
+
+    run_batch(pairs, on_finish, inpaint=inpaint)
 
 def clear_source_list():
     """
     Clears all items from the source list (Column A).
     """
-    cmds.textScrollList(source_list, e=True, removeAll=True)
+    clear_list(source_list)
 
 def clear_target_list():
     """
     Clears all items from the target list (Column B).
     """
-    cmds.textScrollList(target_list, e=True, removeAll=True)
+    clear_list(target_list)
 
 def toggle_mode():
     """
@@ -163,23 +691,31 @@ def sort_column_a():
     """
     Sorts the items in Column A alphabetically.
     """
-    items = cmds.textScrollList(source_list, q=True, allItems=True)
-    if items:
-        sorted_items = sorted(items)
-        cmds.textScrollList(source_list, e=True, removeAll=True)
-        for item in sorted_items:
-            cmds.textScrollList(source_list, e=True, append=item)
+    sort_list(source_list)
 
 def sort_column_b():
     """
     Sorts the items in Column B alphabetically.
     """
-    items = cmds.textScrollList(target_list, q=True, allItems=True)
-    if items:
-        sorted_items = sorted(items)
-        cmds.textScrollList(target_list, e=True, removeAll=True)
-        for item in sorted_items:
-            cmds.textScrollList(target_list, e=True, append=item)
+    sort_list(target_list)
+
+def make_column(title, buttons):
+    """
+    Creates a framed column with a list and one button per (label, handler) pair below it.
+    Args:
+        title (str): Label of the frame.
+        buttons (list): (label, handler) pairs, handlers take no arguments.
+    Returns:
+        str: Name of the created textScrollList.
+    """
+    cmds.columnLayout(adjustableColumn=True)
+    cmds.frameLayout(label=title, borderStyle="etchedIn")
+    scroll_list = cmds.textScrollList(allowMultiSelection=True, height=200, width=230)
+    for label, handler in buttons:
+        cmds.button(label=label, command=lambda *_, handler=handler: handler())
+    cmds.setParent("..")
+    cmds.setParent("..")
+    return scroll_list
 
 def create_ui():
     """
@@ -187,6 +723,7 @@ def create_ui():
     """
     if cmds.window("copySkinWeightsUI", exists=True):
         cmds.deleteUI("copySkinWeightsUI", window=True)
+    item_paths.clear()
 
     window = cmds.window("copySkinWeightsUI", title="Copy Skin Weights Tool", widthHeight=(500, 500))
     cmds.columnLayout(adjustableColumn=True, columnAttach=("both", 5), rowSpacing=10)
@@ -199,33 +736,29 @@ def create_ui():
     cmds.rowLayout(numberOfColumns=2, adjustableColumn=2, columnWidth=[(1, 240), (2, 240)], columnAttach=[(1, 'both', 5), (2, 'both', 5)], columnAlign=[(1, 'center'), (2, 'center')])
 
     # Column A (Source)
-    cmds.columnLayout(adjustableColumn=True)
-    cmds.frameLayout(label="Source (Column A)", borderStyle="etchedIn")
     global source_list
-    source_list = cmds.textScrollList(allowMultiSelection=True, height=200, width=230)
-    cmds.button(label="Add Selected to Column A", command=lambda x: add_to_source())
-    cmds.button(label="Deselect Selected from Column A", command=lambda x: remove_selected_from_source())
-    cmds.button(label="Clear Column A", command=lambda x: clear_source_list())
-    cmds.button(label="Sort Column A", command=lambda x: sort_column_a())
-    cmds.setParent("..")
-    cmds.setParent("..")
+    source_list = make_column("Source (Column A)", [
+        ("Add Selected to Column A", add_to_source),
+        ("Deselect Selected from Column A", remove_selected_from_source),
+        ("Clear Column A", clear_source_list),
+        ("Sort Column A", sort_column_a),
+    ])
 
     # Column B (Target)
-    cmds.columnLayout(adjustableColumn=True)
-    cmds.frameLayout(label="Target (Column B)", borderStyle="etchedIn")
     global target_list
-    target_list = cmds.textScrollList(allowMultiSelection=True, height=200, width=230)
-    cmds.button(label="Add Selected to Column B", command=lambda x: add_to_target())
-    cmds.button(label="Deselect Selected from Column B", command=lambda x: remove_selected_from_target())
-    cmds.button(label="Clear Column B", command=lambda x: clear_target_list())
-    cmds.button(label="Sort Column B", command=lambda x: sort_column_b())
-    cmds.setParent("..")
-    cmds.setParent("..")
+    target_list = make_column("Target (Column B)", [
+        ("Add Selected to Column B", add_to_target),
+        ("Deselect Selected from Column B", remove_selected_from_target),
+        ("Clear Column B", clear_target_list),
+        ("Sort Column B", sort_column_b),
+    ])
 
     cmds.setParent("..")  # End rowLayout
 
     # Control buttons
     cmds.columnLayout(adjustableColumn=True, columnAttach=("both", 5), rowSpacing=10)
+    global inpaint_checkbox
+    inpaint_checkbox = cmds.checkBox(label="Inpaint Unmatched Weights (requires NumPy/SciPy)", value=False, enable=INPAINT_AVAILABLE)
     global copy_button
     copy_button = cmds.button(label="Copy Skin Weights (Single Source)", command=lambda x: copy_weights_button_pressed(), height=50, backgroundColor=(0.4, 0.8, 1.0))
 